@@ -23,9 +23,24 @@ if sys.version_info >= (3, 11):  # AVAILABLE_IN_PY311
 
     # https://docs.python.org/3/library/asyncio-task.html#asyncio.TaskGroup
     from asyncio import TaskGroup
+
+    # https://docs.python.org/3/library/tomllib.html
+    import tomllib
+
+    # https://docs.python.org/3/library/datetime.html#datetime.datetime.fromisoformat
+    # for..  the trailing "Z" (UTC) designator
+    from datetime import datetime as _datetime
+
+    datetime_fromisoformat = _datetime.fromisoformat
 else:
     from typing_extensions import Self
     from typing_extensions import TypedDict
     from exceptiongroup import ExceptionGroup
     from strenum import StrEnum
     from taskgroup import TaskGroup
+    import tomli as tomllib
+
+    from datetime import datetime as _datetime
+
+    def datetime_fromisoformat(date_string: str) -> _datetime:
+        return _datetime.fromisoformat(date_string[:-1] if date_string.endswith("Z") else date_string)
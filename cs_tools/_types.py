@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Annotated, Any, Literal, Optional, Union, cast
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Optional, Union, cast
 import datetime as dt
 import os
 import pathlib
 
-from thoughtspot_tml._tml import TML  # noqa: F401
-
 from cs_tools import _compat
 
+if TYPE_CHECKING:
+    from thoughtspot_tml._tml import TML  # noqa: F401
+
 # ==========
 # Meta types
 # ==========
@@ -151,6 +152,34 @@ class TQLQueryContext(_compat.TypedDict):
     server_schema_version: int
 
 
+_METADATA_TYPE_MAPPINGS: dict[str, dict[str, str]] = {
+    "V1_TO_API": {
+        "PINBOARD_ANSWER_BOOK": "LIVEBOARD",
+        "QUESTION_ANSWER_BOOK": "ANSWER",
+    },
+    "V1_TO_FRIENDLY": {
+        "ONE_TO_ONE_LOGICAL": "TABLE",
+        "USER_DEFINED": "CSV_UPLOAD",
+        "AGGR_WORKSHEET": "VIEW",
+        "SQL_VIEW": "SQL_VIEW",
+        "WORKSHEET": "WORKSHEET",
+        "MODEL": "MODEL",
+        "PINBOARD_ANSWER_BOOK": "LIVEBOARD",
+        "QUESTION_ANSWER_BOOK": "ANSWER",
+    },
+    "FRIENDLY_TO_API": {
+        "CONNECTION": "CONNECTION",
+        "TABLE": "LOGICAL_TABLE",
+        "CSV_UPLOAD": "LOGICAL_TABLE",
+        "VIEW": "LOGICAL_TABLE",
+        "SQL_VIEW": "LOGICAL_TABLE",
+        "MODEL": "LOGICAL_TABLE",
+        "LIVEBOARD": "LIVEBOARD",
+        "ANSWER": "ANSWER",
+    },
+}
+
+
 def lookup_metadata_type(
     metadata_type: str,
     *,
@@ -162,34 +191,7 @@ def lookup_metadata_type(
 
     If strict is True, raise a KeyError if the metadata type is unknown.
     """
-    mappings = {
-        "V1_TO_API": {
-            "PINBOARD_ANSWER_BOOK": "LIVEBOARD",
-            "QUESTION_ANSWER_BOOK": "ANSWER",
-        },
-        "V1_TO_FRIENDLY": {
-            "ONE_TO_ONE_LOGICAL": "TABLE",
-            "USER_DEFINED": "CSV_UPLOAD",
-            "AGGR_WORKSHEET": "VIEW",
-            "SQL_VIEW": "SQL_VIEW",
-            "WORKSHEET": "WORKSHEET",
-            "MODEL": "MODEL",
-            "PINBOARD_ANSWER_BOOK": "LIVEBOARD",
-            "QUESTION_ANSWER_BOOK": "ANSWER",
-        },
-        "FRIENDLY_TO_API": {
-            "CONNECTION": "CONNECTION",
-            "TABLE": "LOGICAL_TABLE",
-            "CSV_UPLOAD": "LOGICAL_TABLE",
-            "VIEW": "LOGICAL_TABLE",
-            "SQL_VIEW": "LOGICAL_TABLE",
-            "MODEL": "LOGICAL_TABLE",
-            "LIVEBOARD": "LIVEBOARD",
-            "ANSWER": "ANSWER",
-        },
-    }
-
-    mapping = mappings[mode.upper()]
+    mapping = _METADATA_TYPE_MAPPINGS[mode.upper()]
     api_type = mapping.get(metadata_type.upper(), None)
 
     if api_type is None:
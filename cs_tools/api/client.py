@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Mapping
 from typing import Any, Optional, Union
 import asyncio
 import datetime as dt
@@ -118,15 +118,33 @@ class RESTAPIClient(httpx.AsyncClient):
         Further reading:
             https://www.python-httpx.org/advanced/#event-hooks
         """
+        # DON'T BUILD (OR REDACT) THE LOG MESSAGE IF NOBODY WILL SEE IT.
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+
         log_msg = f">>> HTTP {request.method} -> {request.url.path}\n\t=== HEADERS ===\n{dict(request.headers)}"
 
         if request.url.params:
-            log_msg += f"\n\t===  PARAMS ===\n{request.url.params}"
+            log_msg += f"\n\t===  PARAMS ===\n{api_utils.obfuscate_sensitive_data(request.url.params)}"
 
-        is_sending_files_to_server = request.headers.get("Content-Type", "").startswith("multipart/form-data")
+        content_type = request.headers.get("Content-Type", "")
+        is_sending_files_to_server = content_type.startswith("multipart/form-data")
 
         if not is_sending_files_to_server and request.content:
-            log_msg += f"\n\t===    DATA ===\n{dict(httpx.QueryParams(request.content.decode()))}"
+            try:
+                if content_type.startswith("application/json"):
+                    data = json.loads(request.content)
+                else:
+                    data = httpx.QueryParams(request.content.decode())
+
+            # WE'RE ONLY BUILDING A LOG MESSAGE, SO DON'T FAIL THE REQUEST OVER A BODY WE CAN'T PARSE.
+            except ValueError:
+                data = request.content
+
+            if isinstance(data, Mapping):
+                data = api_utils.obfuscate_sensitive_data(data)
+
+            log_msg += f"\n\t===    DATA ===\n{data}"
 
         log.debug(f"{log_msg}\n")
 
@@ -141,6 +159,9 @@ class RESTAPIClient(httpx.AsyncClient):
         Further reading:
             https://www.python-httpx.org/advanced/#event-hooks
         """
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+
         requested_at = response.request.headers.get("x-CS Tools-request-dispatch-time-utc", None)
         responsed_at = response.headers.get("x-CS Tools-response-receive-time-utc", None)
 
@@ -1,17 +1,55 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Union
 import logging
 
 log = logging.getLogger(__name__)
+_SAFEWORDS = frozenset(("auth_token", "secret_key", "password", "access_token"))
+_QUERY_SKIP = frozenset(("file", "files"))
 
 
 def scrub_undefined_sentinel(inp: Any, *, null: Any) -> Any:
-    """Recursively remove sentinel values from input parameters."""
-    if isinstance(inp, dict):
-        return {k: scrub_undefined_sentinel(v, null=null) for k, v in inp.items() if v is not null}
+    """Remove sentinel values from input parameters, at any depth."""
+    if not isinstance(inp, (dict, list)):
+        return inp
 
-    if isinstance(inp, list):
-        return [scrub_undefined_sentinel(v, null=null) for v in inp if v is not null]
+    # WALK THE STRUCTURE WITH AN EXPLICIT STACK, SO DEEP PAYLOADS DON'T PAY FOR (OR OVERFLOW) PYTHON FRAMES.
+    scrubbed: Union[dict, list] = {} if isinstance(inp, dict) else []
+    stack: deque[tuple[Union[dict, list], Union[dict, list]]] = deque([(scrubbed, inp)])
 
-    return inp
+    while stack:
+        parent, original = stack.pop()
+        is_mapping = isinstance(parent, dict)
+
+        for key, value in original.items() if is_mapping else enumerate(original):  # type: ignore[union-attr]
+            if value is null:
+                continue
+
+            if isinstance(value, dict):
+                child: Any = {}
+                stack.append((child, value))
+            elif isinstance(value, list):
+                child = []
+                stack.append((child, value))
+            else:
+                child = value
+
+            if is_mapping:
+                parent[key] = child
+            else:
+                parent.append(child)  # type: ignore[union-attr]
+
+    return scrubbed
+
+
+def obfuscate_sensitive_data(request_query: Mapping[str, Any]) -> dict[str, Any]:
+    """Remove sensitive data from request parameters or a JSON body, so they are safe to log."""
+    secure = {k: v for k, v in request_query.items() if k not in _QUERY_SKIP}
+
+    for safe_word in _SAFEWORDS:
+        if safe_word in secure:
+            secure[safe_word] = "[secure]"
+
+    return secure
@@ -8,7 +8,7 @@ from cs_tools.cli import custom_types
 from cs_tools.cli.ux import RICH_CONSOLE, AsyncTyper
 from cs_tools.settings import (
     CSToolsConfig,
-    _meta_config as meta,
+    get_meta_config,
 )
 from cs_tools.thoughtspot import ThoughtSpot
 from cs_tools.updater import cs_tools_venv
@@ -28,8 +28,8 @@ app = AsyncTyper(
     Configuration files can be set and saved on a machine in order to eliminate
     passing cluster details and credentials to every tool.
     """,
-    epilog=f":computer_disk: [fg-success]{meta.default_config_name}[/] (default)"
-    if meta.default_config_name is not None
+    epilog=f":computer_disk: [fg-success]{get_meta_config().default_config_name}[/] (default)"
+    if get_meta_config().default_config_name is not None
     else "",
 )
 
@@ -99,6 +99,7 @@ def create(
 
     else:
         if default:
+            meta = get_meta_config()
             meta.default_config_name = config
             meta.save()
 
@@ -130,7 +131,7 @@ def modify(
     ),
 ):
     """Modify an existing config file."""
-    data = CSToolsConfig.from_name(config, automigrate=True).dict()
+    data = CSToolsConfig.from_name(config, automigrate=True).model_dump()
 
     if url is not None:
         data["thoughtspot"]["url"] = url
@@ -175,6 +176,7 @@ def modify(
 
     else:
         if default is not None:
+            meta = get_meta_config()
             meta.default_config_name = config
             meta.save()
 
@@ -287,6 +289,7 @@ def show(
         return 0
 
     # SHOW A TABLE OF ALL CONFIGURATIONS
+    meta = get_meta_config()
     configs = []
 
     for file in cs_tools_venv.base_dir.iterdir():
@@ -7,7 +7,7 @@ import random
 from cs_tools import __project__, __version__, _compat, _types, datastructures, errors
 from cs_tools.cli._logging import _setup_logging
 from cs_tools.cli.ux import RICH_CONSOLE, AsyncTyper
-from cs_tools.settings import _meta_config as meta
+from cs_tools.settings import get_meta_config
 from rich.align import Align
 from rich.console import ConsoleRenderable
 from rich.panel import Panel
@@ -23,7 +23,7 @@ app = AsyncTyper(
     :wave: [fg-success]Welcome[/] to CS Tools!
 
     \b
-    {meta.newer_version_string()}
+    {get_meta_config().newer_version_string()}
 
     :mage: [fg-warn]Enjoy your superpowers, but be careful![/] :sparkles:
     
@@ -35,8 +35,8 @@ app = AsyncTyper(
         f":bug: [link={__project__.__bugs__}]Found a bug?[/] "
         f":megaphone: [link={__project__.__help__}]Feedback[/][/] "
         + (
-            f":computer_disk: [fg-success]{meta.default_config_name}[/] (default)"
-            if meta.default_config_name is not None
+            f":computer_disk: [fg-success]{get_meta_config().default_config_name}[/] (default)"
+            if get_meta_config().default_config_name is not None
             else ""
         )
     ),
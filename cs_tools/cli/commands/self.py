@@ -11,7 +11,7 @@ import zipfile
 from cs_tools import __version__, _types, updater, utils
 from cs_tools.cli import custom_types
 from cs_tools.cli.ux import RICH_CONSOLE, AsyncTyper
-from cs_tools.settings import _meta_config as meta
+from cs_tools.settings import get_meta_config
 from cs_tools.sync import base
 from cs_tools.updater._bootstrapper import get_latest_cs_tools_release
 from cs_tools.updater._updater import cs_tools_venv
@@ -24,7 +24,7 @@ app = AsyncTyper(
     help=f"""
     Perform actions on CS Tools.
 
-    {meta.newer_version_string()}
+    {get_meta_config().newer_version_string()}
     """,
 )
 
@@ -39,6 +39,8 @@ def info(
     anonymous: bool = typer.Option(False, "--anonymous", help="remove personal references from the output"),
 ) -> _types.ExitCode:
     """Get information on your install."""
+    meta = get_meta_config()
+
     if meta.local_system.is_windows:
         source = f"{pathlib.Path(sys.executable).parent.joinpath('Activate.ps1')}"
     else:
@@ -89,7 +91,7 @@ def sync() -> _types.ExitCode:
     # - tzdata (WIN only) ... WHICH UPDATES USUALLY EVERY YEAR
     PACKAGES_TO_SYNC = ["thoughtspot_tml"]
 
-    if meta.local_system.is_windows:
+    if get_meta_config().local_system.is_windows:
         PACKAGES_TO_SYNC.append("tzdata")
 
     for package in PACKAGES_TO_SYNC:
@@ -155,7 +157,7 @@ def _make_offline_distributable(
     if syncer is not None:
         syncer_base_dir = utils.get_package_directory("cs_tools") / "sync" / syncer.lower()
         assert syncer_base_dir.exists(), f"Syncer dialect '{syncer}' not found, did you mistype it?"
-        syncer_manifest = base.SyncerManifest.model_validate_json(syncer_base_dir.joinpath("MANIFEST.json").read_text())
+        syncer_manifest = base.SyncerManifest.from_json(syncer_base_dir.joinpath("MANIFEST.json").read_bytes())
 
         for requirement_info in syncer_manifest.requirements:
             cs_tools_venv.install(str(requirement_info.requirement), *requirement_info.pip_args)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from cs_tools import __project__, programmatic, utils
 from cs_tools.cli.ux import AsyncTyper
-from cs_tools.settings import _meta_config as meta
+from cs_tools.settings import get_meta_config
 
 app = AsyncTyper(
     name="tools",
@@ -19,8 +19,8 @@ app = AsyncTyper(
         f":bug: [link={__project__.__bugs__}]Found a bug?[/] "
         f":megaphone: [link={__project__.__help__}]Feedback[/][/] "
         + (
-            f":computer_disk: [fg-success]{meta.default_config_name}[/] (default)"
-            if meta.default_config_name is not None
+            f":computer_disk: [fg-success]{get_meta_config().default_config_name}[/] (default)"
+            if get_meta_config().default_config_name is not None
             else ""
         )
     ),
@@ -13,9 +13,8 @@ import urllib
 
 from awesomeversion import AwesomeVersion, AwesomeVersionStrategy, AwesomeVersionStrategyException
 import click
-import toml
 
-from cs_tools import datastructures, utils
+from cs_tools import _compat, datastructures, utils
 from cs_tools.sync import base
 
 _LOG = logging.getLogger(__name__)
@@ -127,7 +126,7 @@ class Directory(CustomType):
     def convert(self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]) -> pathlib.Path:
         """Coerce string into a pathlib.Path.is_dir()."""
         try:
-            path = pathlib.Path(value)
+            path = pathlib.Path(value).resolve()
         except TypeError:
             self.fail(message="Not a valid path", param=param, ctx=ctx)
 
@@ -138,7 +137,7 @@ class Directory(CustomType):
             _LOG.warning(f"The directory '{path}' does not yet exist, creating it..")
             path.mkdir(parents=True, exist_ok=True)
 
-        return path.resolve()
+        return path
 
 
 class Syncer(CustomType):
@@ -152,7 +151,7 @@ class Syncer(CustomType):
     ) -> dict[str, Any]:
         try:
             assert ".toml" in definition_spec, "Syncer definition is not a TOML file, it's likely given as declarative."
-            options = toml.load(definition_spec)
+            options = _compat.tomllib.loads(pathlib.Path(definition_spec).read_text(encoding="utf-8"))
             options = options["configuration"]
 
         except AssertionError:
@@ -162,7 +161,7 @@ class Syncer(CustomType):
         except FileNotFoundError:
             self.fail(message=f"Syncer definition file does not exist at '{definition_spec}'.", param=param, ctx=ctx)
 
-        except toml.TomlDecodeError:
+        except _compat.tomllib.TOMLDecodeError:
             _LOG.debug(f"Syncer definition file '{definition_spec}' is invalid TOML.", exc_info=True)
             self.fail(message=f"Syncer definition file '{definition_spec}' is invalid TOML.", param=param, ctx=ctx)
 
@@ -181,7 +180,7 @@ class Syncer(CustomType):
         # fmt: off
         _LOG.debug(f"Registering syncer: {protocol.lower()}")
         syncer_base_dir = CS_TOOLS_PKG_DIR / "sync" / protocol
-        syncer_manifest = base.SyncerManifest.model_validate_json(syncer_base_dir.joinpath("MANIFEST.json").read_text())
+        syncer_manifest = base.SyncerManifest.from_json(syncer_base_dir.joinpath("MANIFEST.json").read_bytes())
         syncer_options  = self._parse_syncer_configuration(definition_spec, param=param, ctx=ctx)
         # fmt: on
 
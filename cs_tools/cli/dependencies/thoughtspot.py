@@ -9,7 +9,7 @@ import typer
 from cs_tools.cli import custom_types
 from cs_tools.settings import (
     CSToolsConfig as _CSToolsConfig,
-    _meta_config as meta,
+    get_meta_config,
 )
 from cs_tools.sync.base import DatabaseSyncer
 from cs_tools.thoughtspot import ThoughtSpot as _ThoughtSpot
@@ -20,7 +20,7 @@ _LOG = logging.getLogger(__name__)
 _HELP_PANEL_GROUP = "[ThoughtSpot Config Overrides]"
 
 _OPT_CONFIG = typer.Option(
-    ... if meta.default_config_name is None else meta.default_config_name,
+    ... if get_meta_config().default_config_name is None else get_meta_config().default_config_name,
     "--config",
     help="Name of your ThoughtSpot config file.",
     metavar="NAME",
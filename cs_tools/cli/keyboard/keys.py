@@ -44,7 +44,7 @@ class Key(pydantic.BaseModel, arbitrary_types_allowed=True, frozen=True):
     def _fetch_singleton_representation(cls, value: Any_) -> Any_:
         # Otherwise, aliases would override each other.
         try:
-            return _known_keys_cache[value["name"]].dict()
+            return _known_keys_cache[value["name"]].model_dump()
         except KeyError:
             return value
 
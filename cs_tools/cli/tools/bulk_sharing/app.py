@@ -12,6 +12,7 @@ import typer
 
 from cs_tools import _types, utils
 from cs_tools.api import workflows
+from cs_tools.api.client import RESTAPIClient
 from cs_tools.cli import (
     custom_types,
     progress as px,
@@ -44,6 +45,29 @@ def _tick_tock(task: px.WorkTask) -> None:
         task.advance(step=1)
 
 
+async def _resolve_group_guids(groups: list[str], *, http: RESTAPIClient) -> set[_types.GUID]:
+    """Fetch the GUIDs of all the Groups, falling back to one-by-one for those the batch search didn't match."""
+    # RESOLVE ALL THE GROUPS IN A SINGLE REQUEST, THE DEFAULT PAGE SIZE IS SMALLER THAN A TYPICAL --groups LIST.
+    r = await http.metadata_search(
+        guid="",
+        metadata=[{"type": "USER_GROUP", "identifier": g} for g in groups],
+        record_size=len(groups),
+    )
+    d = r.json() if r.is_success else []
+
+    group_guids = {_["metadata_id"] for _ in d}
+    found = group_guids | {_["metadata_header"]["name"] for _ in d}
+
+    if missing := [g for g in groups if g not in found]:
+        d = await utils.bounded_gather(
+            *[workflows.metadata.fetch_one(g, metadata_type="USER_GROUP", http=http) for g in missing],
+            max_concurrent=15,
+        )
+        group_guids.update(_["metadata_id"] for _ in d)
+
+    return group_guids
+
+
 @app.command()
 @depends_on(thoughtspot=ThoughtSpot())
 def cls_ui(ctx: typer.Context, mode: Literal["web", "terminal"] = typer.Option("terminal")) -> _types.ExitCode:
@@ -106,12 +130,8 @@ def from_tag(
             d = utils.run_sync(c)
             guids_to_share.update(_["metadata_id"] for _ in d)
 
-            c = utils.bounded_gather(
-                *[workflows.metadata.fetch_one(identifier=g, metadata_type="USER_GROUP", http=ts.api) for g in groups],
-                max_concurrent=15,
-            )
-            d = utils.run_sync(c)
-            group_guids.update(_["metadata_id"] for _ in d)
+            c = _resolve_group_guids(groups, http=ts.api)
+            group_guids.update(utils.run_sync(c))
 
         with tracker["CONFIRM"] as this_task:
             if no_prompt:
@@ -95,7 +95,7 @@ def branches_commit(
             "Configure your ThoughtSpot<->GitHub integration with [fg-secondary]commit_branch_name[/] instead."
         )
 
-    SYSTEM_USER_GUIDS = ts.session_context.thoughtspot.system_users.values()
+    SYSTEM_USER_GUIDS = frozenset(ts.session_context.thoughtspot.system_users.values())
 
     if input_types == ["ALL"]:
         input_types = ["CONNECTION", "TABLE", "VIEW", "SQL_VIEW", "MODEL", "LIVEBOARD", "ANSWER"]  # type: ignore[assignment]
@@ -120,7 +120,7 @@ def branches_commit(
         if not local_utils.is_allowed_object(
             metadata_object,
             allowed_types=input_types,
-            disallowed_system_users=[] if include_system_owned_content else SYSTEM_USER_GUIDS,
+            disallowed_system_users=frozenset() if include_system_owned_content else SYSTEM_USER_GUIDS,
         ):
             continue
 
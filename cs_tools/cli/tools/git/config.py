@@ -4,7 +4,6 @@ import logging
 
 from httpx import HTTPStatusError
 from rich import box
-from rich.align import Align
 from rich.table import Column, Table
 import httpx
 import typer
@@ -103,11 +102,13 @@ def config_search(
 ):
     """Searches for configurations."""
     ts = ctx.obj.thoughtspot
+    org_identifiers = None
 
     if ts.session_context.thoughtspot.is_orgs_enabled and org_override is not None:
         org = ts.switch_org(org_id=org_override)
+        org_identifiers = [org["id"]]
 
-    c = ts.api.vcs_git_config_search(org_identifiers=None if org_override is None else [org["id"]])
+    c = ts.api.vcs_git_config_search(org_identifiers=org_identifiers)
     r = utils.run_sync(c)
 
     # fmt: off
@@ -127,6 +128,8 @@ def config_search(
             "Yes" if row["enable_guid_mapping"] else "No",
         )
 
-    RICH_CONSOLE.print("\n", Align.center(table), "\n")
+    RICH_CONSOLE.print("\n")
+    RICH_CONSOLE.print(table, justify="center")
+    RICH_CONSOLE.print("\n")
 
     return 0
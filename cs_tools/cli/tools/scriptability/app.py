@@ -105,7 +105,7 @@ def checkpoint(
     """
     ts = ctx.obj.thoughtspot
 
-    SYSTEM_USER_GUIDS = ts.session_context.thoughtspot.system_users.values()
+    SYSTEM_USER_GUIDS = frozenset(ts.session_context.thoughtspot.system_users.values())
 
     if input_types == ["ALL"]:
         input_types = ["CONNECTION", "TABLE", "VIEW", "SQL_VIEW", "MODEL", "LIVEBOARD", "ANSWER"]  # type: ignore[assignment]
@@ -145,7 +145,7 @@ def checkpoint(
         if local_utils.is_allowed_object(
             metadata_object,
             allowed_types=input_types,
-            disallowed_system_users=[] if include_system_owned_content else SYSTEM_USER_GUIDS,
+            disallowed_system_users=frozenset() if include_system_owned_content else SYSTEM_USER_GUIDS,
         )
     ]
 
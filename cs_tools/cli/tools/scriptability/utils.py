@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Any, Literal, Optional, Union
 import datetime as dt
 import json
@@ -21,22 +22,26 @@ _LOG = logging.getLogger(__name__)
 RE_ENVVAR_STRUCTURE = re.compile(r"\$\{\{\s*env\.(?P<envvar>[A-Za-z0-9_]+)\s*\}\}", flags=re.MULTILINE)
 """Variable structure looks like ${{ env.MY_VAR_NAME }} and can be inline with other text."""
 
+_V1_TYPE_ALIASES = {
+    "TABLE": ("ONE_TO_ONE_LOGICAL", "USER_DEFINED"),
+    "VIEW": ("AGGR_WORKSHEET",),
+    "MODEL": ("WORKSHEET",),
+}
+"""Friendly object types which also match their V1 metadata subtypes."""
+
 
 def is_allowed_object(
     metadata_object: _types.APIResult,
-    allowed_types: list[_types.MetadataObjectType],
-    disallowed_system_users: list[_types.GUID],
+    allowed_types: Collection[_types.MetadataObjectType],
+    disallowed_system_users: Collection[_types.GUID],
 ) -> bool:
     """Determines if an object is allowed to be EXPORTED or IMPORTED."""
-    if "TABLE" in allowed_types:
-        allowed_types.append("ONE_TO_ONE_LOGICAL")
-        allowed_types.append("USER_DEFINED")
-
-    if "VIEW" in allowed_types:
-        allowed_types.append("AGGR_WORKSHEET")
+    # CALLED ONCE PER METADATA OBJECT, SO EXPAND INTO A LOCAL SET RATHER THAN GROWING THE CALLER'S LIST EACH TIME.
+    expanded: set[str] = set(allowed_types)
 
-    if "MODEL" in allowed_types:
-        allowed_types.append("WORKSHEET")
+    for friendly_type, v1_types in _V1_TYPE_ALIASES.items():
+        if friendly_type in expanded:
+            expanded.update(v1_types)
 
     #
     #
@@ -45,14 +50,14 @@ def is_allowed_object(
     if metadata_object["author_guid"] in disallowed_system_users:
         return False
 
-    if "ALL" in allowed_types:
+    if "ALL" in expanded:
         return True
 
-    if metadata_object["object_type"] in allowed_types:
+    if metadata_object["object_type"] in expanded:
         return True
 
     if metadata_object["object_type"] == "LOGICAL_TABLE":
-        return metadata_object["object_subtype"] in allowed_types
+        return metadata_object["object_subtype"] in expanded
 
     return False
 
@@ -81,7 +86,7 @@ class MappingCheckpoint(pydantic.BaseModel):
         return None if value is None else value.isoformat()
 
 
-class GUIDMappingInfo(pydantic.BaseModel, extra=pydantic.Extra.forbid):
+class GUIDMappingInfo(pydantic.BaseModel, extra="forbid"):
     """
     Wrapper for guid mapping to make it easier to use.
 
@@ -110,7 +115,7 @@ class GUIDMappingInfo(pydantic.BaseModel, extra=pydantic.Extra.forbid):
         """Load the GUID mapping info."""
         try:
             assert path is not None, "--> raise FileNotFoundError"
-            info = cls.parse_obj(json.loads(path.read_text(encoding="utf-8")))
+            info = cls.model_validate(json.loads(path.read_text(encoding="utf-8")))
 
         except pydantic.ValidationError:
             raise
@@ -451,11 +456,14 @@ class TMLOperations:
         t.add_column("Message", width=150 - 5 - 14 - 40 - 28, no_wrap=True)
         # fmt: on
 
+        # BIND ONCE, THERE CAN BE THOUSANDS OF STATUSES IN A SINGLE EXPORT/IMPORT.
+        add_row = t.add_row
+
         for response in self.statuses:
             n = len(response.cleaned_messages)
             s = "" if n <= 1 else "s"
 
-            t.add_row(
+            add_row(
                 response.emoji,
                 response.metadata_type,
                 response.metadata_guid,
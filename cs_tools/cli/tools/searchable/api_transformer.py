@@ -574,7 +574,11 @@ def ts_bi_server(data: list[_types.APIResult], *, cluster: _types.GUID) -> _type
     seen: set[str] = set()
 
     # ENSURE ALL DATA IS IN UTC PRIOR TO GENERATING ROW_NUMBERS.
-    data = [{**row, "Timestamp": validators.ensure_datetime_is_utc.func(row["Timestamp"])} for row in data]
+    # (updated in place, copying every row of a large BI Server extract is expensive)
+    to_utc = validators.ensure_datetime_is_utc.func
+
+    for row in data:
+        row["Timestamp"] = to_utc(row["Timestamp"])
 
     # SORT PRIOR TO GROUP BY SO WE MAINTAIN CLUSTERING KEY SEMANTICS
     data.sort(key=operator.itemgetter(*CLUSTER_KEY))
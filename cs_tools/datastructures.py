@@ -11,10 +11,11 @@ This includes things that will change based on submitted user configuration.
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Optional, Union
+from typing import Annotated, Any, Optional
 import datetime as dt
 import logging
 import platform
+import re
 import sys
 import zoneinfo
 
@@ -27,6 +28,8 @@ import sqlmodel
 from cs_tools import __project__, __version__, _types, utils, validators
 
 log = logging.getLogger(__name__)
+_RELEASE_VERSION_RE = re.compile(r"(v?\d+)(?:\.(\d+))?(?:\.(\d+))?")
+_GROUP_PRIVILEGE_NAMES = frozenset(p.value for p in _types.GroupPrivilege)
 _COMMON_MODEL_CONFIG = {
     "arbitrary_types_allowed": True,
     "extra": "allow",
@@ -133,6 +136,9 @@ class LocalSystemInfo(_GlobalModel):
 class ThoughtSpotInfo(_GlobalModel):
     """Information about the ThoughtSpot cluster we've established a session with."""
 
+    # DROP THE RAW SESSION API PAYLOADS RATHER THAN CARRYING THEM AROUND AS EXTRAS.
+    model_config = pydantic.ConfigDict(extra="ignore")
+
     cluster_id: str
     cluster_name: Optional[str] = "UNKNOWN"
     url: pydantic.AnyUrl
@@ -147,7 +153,12 @@ class ThoughtSpotInfo(_GlobalModel):
     @pydantic.model_validator(mode="before")
     @classmethod
     def check_if_from_session_info(cls, data: Any) -> Any:
-        if system_info := data.get("__system_info__", {}):
+        return cls._reshape_session_info(data)
+
+    @classmethod
+    def _reshape_session_info(cls, data: Any) -> Any:
+        """Map the ThoughtSpot session APIs onto our fields, if that's where the data came from."""
+        if system_info := data.get("__system_info__", None):
             data["cluster_id"] = system_info["id"]
             data["cluster_name"] = system_info["name"]
             data["url"] = data["__url__"]
@@ -162,20 +173,29 @@ class ThoughtSpotInfo(_GlobalModel):
                 "su": system_info["super_user_id"],
             }
 
-        if overrides_info := data.get("__overrides_info__", {}).get("config_override_info", {}):
+        try:
+            overrides_info = data["__overrides_info__"]["config_override_info"]
+        except (KeyError, TypeError):
+            overrides_info = None
+
+        if overrides_info:
             # data["is_roles_enabled"] = overrides_info.get("orion.rolesEnabled", False)
             # data["is_iam_v2_enabled"] = overrides_info.get("orion.oktaEnabled", False)
-            data["is_iam_v2_enabled"] = overrides_info.get("oidcConfiguration.iamV2OIDCEnabled", {}).get(
-                "current", False
-            )
+            try:
+                data["is_iam_v2_enabled"] = overrides_info["oidcConfiguration.iamV2OIDCEnabled"]["current"]
+            except (KeyError, TypeError):
+                data["is_iam_v2_enabled"] = False
 
         return data
 
     @pydantic.field_validator("version", mode="before")
     @classmethod
     def sanitize_release_version(cls, version_string: str) -> AwesomeVersion:
-        major, minor, micro, *rest = version_string.split(".")
-        return AwesomeVersion(f"{major}.{minor}.{micro}")
+        if (match := _RELEASE_VERSION_RE.match(version_string)) is None:
+            raise ValueError(f"value should be a ThoughtSpot release version, got {version_string}")
+
+        major, minor, micro = match.groups(default="0")
+        return validators.ensure_valid_version.func(f"{major}.{minor}.{micro}")
 
     @pydantic.field_validator("timezone", mode="before")
     @classmethod
@@ -192,14 +212,30 @@ class ThoughtSpotInfo(_GlobalModel):
     def serialize_as_str(cls, value: Any) -> str:
         return str(value)
 
+    @classmethod
+    def from_session_info(cls, data: dict[str, Any]) -> ThoughtSpotInfo:
+        """Build from the ThoughtSpot session APIs, which we trust, without re-validating every field."""
+        data = cls._reshape_session_info(data)
+
+        return cls.model_construct(
+            **{
+                **data,
+                "url": pydantic.AnyUrl(str(data["url"])),
+                "version": cls.sanitize_release_version(data["version"]),
+                "timezone": cls.sanitize_timezone_name(data["timezone"]),
+            }
+        )
+
 
 class UserInfo(_GlobalModel):
     """Information about the logged in user."""
 
+    model_config = pydantic.ConfigDict(extra="ignore")
+
     guid: _types.GUID
     username: str
     display_name: str
-    privileges: set[Union[_types.GroupPrivilege, str]]
+    privileges: set[str]
     org_context: Optional[int] = None
     email: Optional[pydantic.EmailStr] = None
     auth_context: _types.AuthContext = "NONE"
@@ -207,13 +243,23 @@ class UserInfo(_GlobalModel):
     @pydantic.model_validator(mode="before")
     @classmethod
     def check_if_from_session_info(cls, data: Any) -> Any:
-        if session_info := data.get("__session_info__", {}):
+        return cls._reshape_session_info(data)
+
+    @classmethod
+    def _reshape_session_info(cls, data: Any) -> Any:
+        """Map the ThoughtSpot session APIs onto our fields, if that's where the data came from."""
+        if session_info := data.get("__session_info__", None):
+            try:
+                org_context = session_info["current_org"]["id"]
+            except (KeyError, TypeError):
+                org_context = None
+
             data = {
                 "guid": session_info["id"],
                 "username": session_info["name"],
                 "display_name": session_info["display_name"],
                 "privileges": session_info["privileges"],
-                "org_context": (session_info.get("current_org", None) or {}).get("id", None),
+                "org_context": org_context,
                 "email": session_info["email"],
                 "auth_context": data["__auth_context__"],
             }
@@ -224,9 +270,7 @@ class UserInfo(_GlobalModel):
     @classmethod
     def check_for_new_or_extra_privileges(cls, data):
         for privilege in data:
-            try:
-                _types.GroupPrivilege(privilege)
-            except ValueError:
+            if privilege not in _GROUP_PRIVILEGE_NAMES:
                 log.debug(
                     f"Missing privilege '{privilege}' from CS Tools, please contact us to update it"
                     f"\n{__project__.__help__}"
@@ -234,6 +278,15 @@ class UserInfo(_GlobalModel):
 
         return data
 
+    @classmethod
+    def from_session_info(cls, data: dict[str, Any]) -> UserInfo:
+        """Build from the ThoughtSpot session APIs, which we trust, without re-validating every field."""
+        data = cls._reshape_session_info(data)
+
+        return cls.model_construct(
+            **{**data, "privileges": set(cls.check_for_new_or_extra_privileges(data["privileges"]))}
+        )
+
     @pydantic.computed_field
     @property
     def is_admin(self) -> bool:
@@ -253,7 +306,7 @@ class SessionContext(_GlobalModel):
     """Information about the current CS Tools session."""
 
     cs_tools_version: validators.CoerceVersion = AwesomeVersion(__version__)
-    environment: ExecutionEnvironment = ExecutionEnvironment()
+    environment: ExecutionEnvironment = pydantic.Field(default_factory=ExecutionEnvironment)
     thoughtspot: ThoughtSpotInfo
-    system: LocalSystemInfo = LocalSystemInfo()
+    system: LocalSystemInfo = pydantic.Field(default_factory=LocalSystemInfo)
     user: UserInfo
@@ -10,9 +10,9 @@ from typing import Annotated, Any, Optional, Union
 import binascii
 import datetime as dt
 import ipaddress
-import json
 import logging
 import pathlib
+import string
 import urllib
 import urllib.error
 import uuid
@@ -21,7 +21,7 @@ import zlib
 from awesomeversion import AwesomeVersion
 import pydantic
 import rich
-import toml
+import tomli_w
 
 from cs_tools import __project__, __version__, _compat, _types, errors, utils, validators
 from cs_tools.datastructures import ExecutionEnvironment, LocalSystemInfo, _GlobalModel, _GlobalSettings
@@ -30,6 +30,19 @@ from cs_tools.updater._bootstrapper import get_latest_cs_tools_release
 
 _LOG = logging.getLogger(__name__)
 _FOUNDING_DAY = dt.datetime(year=2012, month=6, day=1, tzinfo=dt.timezone.utc)
+_VENV_VERSION = AwesomeVersion(__version__)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_SECRET_KEYS = frozenset(("password", "secret_key", "bearer_token"))
+_B64_ALPHABET = frozenset(string.ascii_letters + string.digits + "+/=_-")
+_META_CONFIG_CACHE: Optional[tuple[Optional[int], MetaConfig]] = None
+
+
+def _mtime_or_none(path: pathlib.Path) -> Optional[int]:
+    """Fetch the last modified time of a file, if it exists."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 class RemoteRepositoryInfo(_GlobalModel):
@@ -52,10 +65,10 @@ class MetaConfig(_GlobalModel):
 
     install_uuid: uuid.UUID = pydantic.Field(default_factory=uuid.uuid4)
     default_config_name: Optional[str] = None
-    remote: RemoteRepositoryInfo = RemoteRepositoryInfo()
-    environment: ExecutionEnvironment = ExecutionEnvironment()
+    remote: RemoteRepositoryInfo = pydantic.Field(default_factory=RemoteRepositoryInfo)
+    environment: ExecutionEnvironment = pydantic.Field(default_factory=ExecutionEnvironment)
     created_in_cs_tools_version: validators.CoerceVersion = __version__
-    local_system: LocalSystemInfo = LocalSystemInfo()
+    local_system: LocalSystemInfo = pydantic.Field(default_factory=LocalSystemInfo)
 
     _new_version_notified_ack: bool = False
 
@@ -70,6 +83,7 @@ class MetaConfig(_GlobalModel):
                     "version": data.get("latest_release", {}).get("version", None),
                     "published_at": data.get("latest_release", {}).get("published_at", None),
                 },
+                "created_in_cs_tools_version": __version__,
                 "__cs_tools_context__": {"config_migration": {"from": "<1.4.0", "to": __version__}},
             }
 
@@ -105,22 +119,29 @@ class MetaConfig(_GlobalModel):
         return data
 
     @classmethod
-    def load(cls) -> _compat.Self:
+    def load(cls) -> MetaConfig:
         """Read the meta-config."""
+        global _META_CONFIG_CACHE
+
         app_dir = cs_tools_venv.base_dir
 
         OLD_FORMAT = app_dir / ".meta-config.toml"
         NEW_FORMAT = app_dir / ".meta-config.json"
 
+        # RE-USE THE META-CONFIG FOR THE PROCESS, UNLESS THE FILE HAS CHANGED UNDERNEATH US.
+        if _META_CONFIG_CACHE is not None and not OLD_FORMAT.exists():
+            last_mtime, instance = _META_CONFIG_CACHE
+
+            if last_mtime == _mtime_or_none(NEW_FORMAT):
+                return instance
+
         if OLD_FORMAT.exists():
-            data = toml.load(OLD_FORMAT)
+            data = _compat.tomllib.loads(OLD_FORMAT.read_text(encoding="utf-8"))
             instance = cls(**data, __is_old_format__=True)
-            instance = cls(**data)
             OLD_FORMAT.unlink()
 
         elif NEW_FORMAT.exists():
-            data = json.loads(NEW_FORMAT.read_text())
-            instance = cls(**data)
+            instance = cls.model_validate_json(NEW_FORMAT.read_bytes())
 
         else:
             instance = cls()
@@ -137,10 +158,14 @@ class MetaConfig(_GlobalModel):
                 instance.save()
 
         instance.check_remote_version()
+
+        _META_CONFIG_CACHE = (_mtime_or_none(NEW_FORMAT), instance)
         return instance
 
     def save(self) -> None:
         """Store the meta-config."""
+        global _META_CONFIG_CACHE
+
         if self.environment.is_ci:
             return
 
@@ -154,16 +179,19 @@ class MetaConfig(_GlobalModel):
 
         full_path.write_text(data)
 
+        # WE JUST WROTE THE FILE, SO WE ARE STILL THE MOST UP-TO-DATE META-CONFIG.
+        if _META_CONFIG_CACHE is not None and _META_CONFIG_CACHE[1] is self:
+            _META_CONFIG_CACHE = (_mtime_or_none(full_path), self)
+
     def check_remote_version(self) -> None:
         """Check GitHub for the latest cs_tools version."""
         TIMEOUT_AFTER = 0.33
-        venv_version = AwesomeVersion(__version__)
 
         # DONT CHECK REMOTE TOO OFTEN
         # - every 5 hours for BETA
         # - every 1 day   for GENERALLY AVAILABLE
         current_time = dt.datetime.now(tz=dt.timezone.utc)
-        remote_delta = dt.timedelta(hours=5) if venv_version.beta else dt.timedelta(days=1)
+        remote_delta = dt.timedelta(hours=5) if _VENV_VERSION.beta else dt.timedelta(days=1)
 
         if (current_time - self.remote.last_checked) <= remote_delta:
             return
@@ -185,7 +213,7 @@ class MetaConfig(_GlobalModel):
 
     def newer_version_string(self) -> str:
         """Return the CLI new version media string."""
-        if AwesomeVersion(self.remote.version or "v0.0.0") <= AwesomeVersion(__version__):
+        if self.remote.version is None or self.remote.version <= _VENV_VERSION:
             return ""
 
         from cs_tools.cli.ux import RICH_CONSOLE
@@ -224,8 +252,20 @@ class MetaConfig(_GlobalModel):
         return ":tada: [fg-success]A new CS Tools version is available![/]"
 
 
-# GLOBAL SCOPE
-_meta_config = MetaConfig.load()
+def get_meta_config() -> MetaConfig:
+    """Fetch the MetaConfig for this process, loading it on first use."""
+    # MetaConfig.load() CACHES ITS RESULT AGAINST THE FILE'S MTIME, SO THIS STAYS CHEAP TO CALL.
+    return MetaConfig.load()
+
+
+def __getattr__(name: str) -> Any:
+    # Support the legacy module-level access to the MetaConfig.
+    # eg. from cs_tools.settings import _meta_config as meta
+    #
+    if name == "_meta_config":
+        return get_meta_config()
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 class ThoughtSpotConfiguration(_GlobalSettings):
@@ -242,7 +282,7 @@ class ThoughtSpotConfiguration(_GlobalSettings):
     @classmethod
     def ensure_at_least_one_secret(cls, values: Any) -> Any:
         """Must provide one of Password, Secret Key, Bearer Token."""
-        if "password" not in values and "secret_key" not in values and "bearer_token" not in values:
+        if _SECRET_KEYS.isdisjoint(values):
             raise ValueError(
                 "missing one or more of the following keyword arguments: 'password', 'secret_key', 'bearer_token'"
             )
@@ -255,12 +295,14 @@ class ThoughtSpotConfiguration(_GlobalSettings):
         if data is None:
             return None
 
-        try:
-            utils.reveal(data.encode()).decode()
-        except (binascii.Error, zlib.error):
-            pass
-        else:
-            return data
+        # ONLY AN ALREADY-OBSCURED PASSWORD CAN BE BASE64, SO DON'T BOTHER DECODING ANYTHING ELSE.
+        if len(data) % 4 == 0 and _B64_ALPHABET.issuperset(data):
+            try:
+                utils.reveal(data.encode()).decode()
+            except (binascii.Error, zlib.error):
+                pass
+            else:
+                return data
 
         return utils.obscure(data).decode()
 
@@ -270,15 +312,9 @@ class ThoughtSpotConfiguration(_GlobalSettings):
         if isinstance(data, ipaddress.IPv4Address):
             return f"https://{data}"
 
-        netloc = data.host
-
-        if data.scheme == "http" and data.port != 80:
-            netloc += f":{data.port}"
+        port = "" if data.port in (None, _DEFAULT_PORTS.get(data.scheme)) else f":{data.port}"
 
-        if data.scheme == "https" and data.port != 443:
-            netloc += f":{data.port}"
-
-        return f"{data.scheme}://{netloc}"
+        return f"{data.scheme}://{data.host}{port}"
 
     @property
     def decoded_password(self) -> str:
@@ -297,7 +333,7 @@ class CSToolsConfig(_GlobalSettings):
     name: str
     thoughtspot: ThoughtSpotConfiguration
     verbose: bool = False
-    temp_dir: pydantic.DirectoryPath = cs_tools_venv.subdir(".tmp")
+    temp_dir: pydantic.DirectoryPath = pydantic.Field(default_factory=lambda: cs_tools_venv.subdir(".tmp"))
     created_in_cs_tools_version: validators.CoerceVersion = __version__
 
     @pydantic.model_validator(mode="before")
@@ -411,7 +447,7 @@ class CSToolsConfig(_GlobalSettings):
     def from_toml(cls, path: pathlib.Path, automigrate: bool = False) -> CSToolsConfig:
         """Read in a cluster-config.toml file."""
         try:
-            data = toml.load(path)
+            data = _compat.tomllib.loads(path.read_text(encoding="utf-8"))
         except FileNotFoundError:
             raise errors.ConfigDoesNotExist(config_name=path.stem.replace("cluster-cfg_", "")) from None
 
@@ -467,5 +503,7 @@ class CSToolsConfig(_GlobalSettings):
         # Remove the extras, we don't need to save that bit.
         self.__pydantic_extra__ = {}
 
-        with full_path.open(mode="w") as t:
-            toml.dump(self.model_dump(), t)
+        # TOML has no null, so unset optionals are left out of the file entirely.
+        data = tomli_w.dumps(self.model_dump(exclude_none=True))
+
+        full_path.write_bytes(data.encode("utf-8"))
@@ -1,49 +1,66 @@
 from __future__ import annotations
 
-from typing import Any, Literal, Optional
+from typing import ClassVar, Literal, Optional, Union
+import dataclasses
 import functools as ft
+import importlib.metadata
 import importlib.util
+import json
 import logging
 import pathlib
 import sys
 import warnings
 
 from packaging.requirements import Requirement
+from packaging.utils import canonicalize_name
 import pydantic
 import sqlalchemy as sa
 import sqlmodel
 
 from cs_tools import _types, errors
-from cs_tools.datastructures import ExecutionEnvironment, ValidatedSQLModel, _GlobalModel, _GlobalSettings
+from cs_tools.datastructures import ExecutionEnvironment, ValidatedSQLModel, _GlobalSettings
 from cs_tools.updater._updater import cs_tools_venv
 
 log = logging.getLogger(__name__)
 _registry: set[str] = set()
 
 
-class PipRequirement(_GlobalModel):
+@dataclasses.dataclass
+class PipRequirement:
     requirement: Requirement
-    pip_args: list[str] = []  # noqa: RUF012
+    pip_args: list[str] = dataclasses.field(default_factory=list)
 
-    @pydantic.model_validator(mode="before")
     @classmethod
-    def json_tuple_to_dict(cls, data: Any) -> Any:
+    def from_json(cls, data: Union[str, list[str]]) -> PipRequirement:
+        """Parse a MANIFEST requirement, either "requirement" or ["requirement", *pip_args]."""
         if isinstance(data, str):
-            return {"requirement": Requirement(data)}
+            return cls(requirement=Requirement(data))
 
         requirement, *args = data
-        return {"requirement": Requirement(requirement), "pip_args": args}
+        return cls(requirement=Requirement(requirement), pip_args=args)
 
     def __str__(self) -> str:
         return f"{self.requirement} {' '.join(self.pip_args)}"
 
 
-class SyncerManifest(_GlobalModel):
+@dataclasses.dataclass
+class SyncerManifest:
     name: str
     syncer_class: str
-    requirements: list[PipRequirement] = []  # noqa: RUF012
+    requirements: list[PipRequirement] = dataclasses.field(default_factory=list)
 
-    __syncer_name__: Optional[str] = None
+    __syncer_name__: ClassVar[Optional[str]] = None
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> SyncerManifest:
+        """Parse a Syncer's MANIFEST.json."""
+        manifest = json.loads(data)
+
+        return cls(
+            name=manifest["name"],
+            syncer_class=manifest["syncer_class"],
+            requirements=[PipRequirement.from_json(r) for r in manifest.get("requirements", [])],
+        )
 
     def import_syncer_class(self, fp: pathlib.Path) -> type[Syncer]:
         __name__ = f"cs_tools_{fp.parent.stem}_syncer"  # noqa: A001
@@ -72,9 +89,24 @@ class SyncerManifest(_GlobalModel):
         if ExecutionEnvironment().is_ci:
             log.info(f"RUNNING IN CI: skipping install of requirements.. {self.requirements}")
         else:
+            # SNAPSHOT THE ENVIRONMENT ONCE, SO WE ONLY SHELL OUT TO THE INSTALLER FOR WHAT'S MISSING.
+            installed = {
+                canonicalize_name(name): d.version
+                for d in importlib.metadata.distributions()
+                if (name := d.metadata["Name"]) is not None
+            }
+
             for pip_requirement in self.requirements:
+                requirement = pip_requirement.requirement
+                version = installed.get(canonicalize_name(requirement.name))
+
+                # EXTRAS MAY PULL IN PACKAGES WE CAN'T SEE FROM THE NAME ALONE, SO LET THE INSTALLER DECIDE.
+                if version is not None and not requirement.extras and requirement.specifier.contains(version, True):
+                    log.debug(f"Requirement already satisfied: {pip_requirement}")
+                    continue
+
                 log.debug(f"Processing requirement: {pip_requirement}")
-                cs_tools_venv.install(f"{pip_requirement.requirement}", *pip_requirement.pip_args, hush_logging=True)
+                cs_tools_venv.install(f"{requirement}", *pip_requirement.pip_args, hush_logging=True)
 
         # Registration is successful, we can add it to the global now.
         _registry.add(__syncer_name__)
@@ -96,18 +128,21 @@ class Syncer(_GlobalSettings, extra="forbid"):
         if cls.__manifest_path__ is None or cls.__syncer_name__ is None:
             raise NotImplementedError("Syncers must implement both '__syncer_name__' and '__manifest_path__'")
 
-        cls.__init__ = ft.partialmethod(cls.__lifecycle_init__, __original_init__=cls.__init__)  # type: ignore
+        __original_init__ = cls.__init__
+
+        @ft.wraps(__original_init__)
+        def __lifecycle_init__(child_self, *a, **kw) -> None:
+            """Hook into __init__ so we can call our own post-init function."""
+            try:
+                __original_init__(child_self, *a, **kw)
 
-    def __lifecycle_init__(child_self, *a, __original_init__, **kw):
-        """Hook into __init__ so we can call our own post-init function."""
-        try:
-            __original_init__(child_self, *a, **kw)
+            except pydantic.ValidationError as e:
+                log.debug(e, exc_info=True)
+                raise errors.SyncerInitError(protocol=e.title, pydantic_error=e) from None
 
-        except pydantic.ValidationError as e:
-            log.debug(e, exc_info=True)
-            raise errors.SyncerInitError(protocol=e.title, pydantic_error=e) from None
+            child_self.__finalize__()
 
-        child_self.__finalize__()
+        cls.__init__ = __lifecycle_init__  # type: ignore[method-assign,assignment]
 
     def __finalize__(self) -> None:
         """Will be called after __init__()."""
@@ -145,7 +180,7 @@ class Syncer(_GlobalSettings, extra="forbid"):
 class DatabaseSyncer(Syncer, is_base_class=True):
     """A connection to an Database."""
 
-    metadata: sqlmodel.MetaData = sqlmodel.MetaData()
+    metadata: sqlmodel.MetaData = pydantic.Field(default_factory=sqlmodel.MetaData)
     models: list[type[ValidatedSQLModel]] = []  # noqa: RUF012
     load_strategy: Literal["APPEND", "TRUNCATE", "UPSERT"] = "APPEND"
 
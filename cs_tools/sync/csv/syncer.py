@@ -13,6 +13,7 @@ from cs_tools.sync import utils as sync_utils
 from cs_tools.sync.base import Syncer
 
 log = logging.getLogger(__name__)
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, so large dumps drain to disk in fewer write() calls.
 
 
 class CSV(Syncer):
@@ -137,11 +138,12 @@ class CSV(Syncer):
         header = data[0].keys()
         mode = "a" if self.save_strategy == "APPEND" else "w"
 
-        with path.open(mode=mode, newline="", encoding="utf-8") as f:
+        with path.open(mode=mode, newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=header, **self.dialect_and_format_parameters())
 
             if self.header and filename not in self._written_header:
                 self._written_header[filename] = True
                 writer.writeheader()
 
-            writer.writerows([sync_utils.format_datetime_values(r, dt_format=self.date_time_format) for r in data])
+            # STREAM THE FORMATTED ROWS STRAIGHT INTO THE C-LEVEL writerows LOOP, RATHER THAN COPYING ALL OF data FIRST.
+            writer.writerows(sync_utils.format_datetime_values(r, dt_format=self.date_time_format) for r in data)
@@ -9,7 +9,7 @@ import httpx
 
 from cs_tools import _types, errors, utils
 from cs_tools.api.client import RESTAPIClient
-from cs_tools.datastructures import LocalSystemInfo, SessionContext
+from cs_tools.datastructures import LocalSystemInfo, SessionContext, ThoughtSpotInfo, UserInfo
 from cs_tools.settings import CSToolsConfig
 
 _LOG = logging.getLogger(__name__)
@@ -86,7 +86,7 @@ class ThoughtSpot:
             "__auth_context__": auth_type,
         }
 
-        ctx = SessionContext(thoughtspot=d, user=d)
+        ctx = SessionContext(thoughtspot=ThoughtSpotInfo.from_session_info(d), user=UserInfo.from_session_info(d))
 
         if _NOT_IN_DESIRED_ORG := (desired_org_id is not None and ctx.user.org_context != desired_org_id):
             # DEV NOTE: @boonhapus, 2025/01/21
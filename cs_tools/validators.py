@@ -6,66 +6,100 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 import datetime as dt
+import functools as ft
+import re
 import uuid
 
 import awesomeversion
 import pydantic
 
+from cs_tools import _compat
+
 METHOD_CONFIG = pydantic.ConfigDict(arbitrary_types_allowed=True)
 
+_UTC = dt.timezone.utc
+_MIDNIGHT = dt.time(0, 0)
+_UUID4_HEX_RE = re.compile(r"[0-9a-f]{12}4[0-9a-f]{3}[89ab][0-9a-f]{15}")
+_UUID4_DASHED_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+# BUILD THESE VALIDATORS ONCE, RATHER THAN ON EVERY CALL.
+_ANY_HTTP_URL = pydantic.TypeAdapter(pydantic.AnyHttpUrl)
+_ANY_URL = pydantic.TypeAdapter(pydantic.networks.AnyUrl)
+
+
+@ft.lru_cache(maxsize=64)
+def _parse_version(version_string: str) -> awesomeversion.AwesomeVersion:
+    """AwesomeVersions are immutable, and we see the same handful of them over and over."""
+    return awesomeversion.AwesomeVersion(version_string)
+
+
 # =========================== VALIDATORS ======================================
 # - be decorated with PlainValidator or WrapValidator
 # - be prefixed with `ensure_`
+# - coerce a single value outside of a model with `ensure_<name>.func(value)`
 #
 
 
-@pydantic.PlainValidator
-def ensure_datetime_is_utc(value: Any) -> pydantic.AwareDatetime:
-    """Ensures the input value is a valid, aware, datetime."""
+@ft.singledispatch
+def _datetime_from(value: Any) -> dt.datetime:
+    raise ValueError(f"value should be a valid datetime representation, got {value}")
+
+
+@_datetime_from.register(dt.datetime)
+def _datetime_from_datetime(value: dt.datetime) -> dt.datetime:
+    # NAIVE DATETIME
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+
     # HAPPIEST CASE
-    if (value_is_a_datetime := isinstance(value, dt.datetime)) and value.tzinfo == dt.timezone.utc:
+    if value.tzinfo is _UTC:
         return value
 
-    # TIMESTAMP (most common case from api)
-    elif isinstance(value, (int, float)):
-        try:
-            return dt.datetime.fromtimestamp(value, tz=dt.timezone.utc)
-        except (OverflowError, OSError) as e:
-            raise ValueError(f"value is too large to be a POSIX timestamp, got {value}") from e
+    # WRONG TIMEZONE
+    return value.astimezone(tz=_UTC)
 
-    # ISO-FORMATTED DATETIME STRING
-    elif isinstance(value, str):
-        if value.endswith("Z"):
-            value = value.removesuffix("Z")
 
-        value = dt.datetime.fromisoformat(value)
-        value_is_a_datetime = True
+@_datetime_from.register(int)
+@_datetime_from.register(float)
+def _datetime_from_timestamp(value: float) -> dt.datetime:
+    try:
+        return dt.datetime.fromtimestamp(value, tz=_UTC)
+    except (OverflowError, OSError) as e:
+        raise ValueError(f"value is too large to be a POSIX timestamp, got {value}") from e
 
-    #
-    # FORMATTED DATETIME.
-    #
 
-    # NAIVE DATETIME
-    if value_is_a_datetime and value.tzinfo is None:
-        return value.replace(tzinfo=dt.timezone.utc)
+@_datetime_from.register(str)
+def _datetime_from_isoformat(value: str) -> dt.datetime:
+    parsed = _compat.datetime_fromisoformat(value)
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=_UTC)
+
+    return parsed.astimezone(tz=_UTC)
 
-    # WRONG TIMEZONE
-    elif value_is_a_datetime and value.tzinfo != dt.timezone.utc:
-        return value.astimezone(tz=dt.timezone.utc)
 
-    # DATE (NAIVE DATETIME)
-    elif isinstance(value, dt.date):
-        return dt.datetime.combine(value, dt.datetime.min.time(), tzinfo=dt.timezone.utc)
+@_datetime_from.register(dt.date)
+def _datetime_from_date(value: dt.date) -> dt.datetime:
+    return dt.datetime.combine(value, _MIDNIGHT, tzinfo=_UTC)
 
-    else:
-        raise ValueError(f"value should be a valid datetime representation, got {value}")
 
-    assert 1 == 0, "This should be unreachable."
+@pydantic.PlainValidator
+def ensure_datetime_is_utc(value: Any) -> pydantic.AwareDatetime:
+    """Ensures the input value is a valid, aware, datetime."""
+    return _datetime_from(value)
 
 
 @pydantic.PlainValidator
 def ensure_valid_uuid4(value: Any) -> str:
     """Ensures the input value is a valid UUID4, in hex-string format."""
+    # FAST PATH: IT'S ALREADY A CANONICAL UUID4, SO uuid.UUID WOULD HAND BACK THE SAME HEX.
+    if isinstance(value, str):
+        if _UUID4_HEX_RE.fullmatch(value):
+            return value
+
+        if _UUID4_DASHED_RE.fullmatch(value):
+            return value.replace("-", "")
+
     if not isinstance(value, uuid.UUID):
         value = uuid.UUID(value, version=4)
 
@@ -75,19 +109,22 @@ def ensure_valid_uuid4(value: Any) -> str:
 @pydantic.PlainValidator
 def ensure_url_string(value: Any) -> str:
     """Ensures the input value is a valid HTTP URL."""
-    return str(pydantic.AnyHttpUrl(value))
+    return str(_ANY_HTTP_URL.validate_python(value))
 
 
 @pydantic.PlainValidator
 def ensure_valid_version(value: Any) -> awesomeversion.AwesomeVersion:
     """Ensures the input value is a valid version."""
+    if isinstance(value, str):
+        return _parse_version(value)
+
     return awesomeversion.AwesomeVersion(value)
 
 
 @pydantic.PlainValidator
 def ensure_stringified_url_format(value: Any) -> str:
     """Ensures the input value is a valid HTTP/s string."""
-    return str(pydantic.networks.AnyUrl(value))
+    return str(_ANY_URL.validate_python(value))
 
 
 # =========================== SERIALIZERS =====================================
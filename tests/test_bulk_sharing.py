@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any
+
+from cs_tools import utils
+from cs_tools.cli.tools.bulk_sharing.app import _resolve_group_guids
+import httpx
+import pytest
+
+# THE API HANDS BACK THIS MANY OBJECTS WHEN record_size IS NOT SPECIFIED.
+_DEFAULT_RECORD_SIZE = 10
+
+
+class FakeMetadataSearch:
+    """Serves /metadata/search for a fixed set of Groups, recording each request."""
+
+    def __init__(self, groups: dict[str, str]):
+        self.groups = groups
+        self.requests: list[dict[str, Any]] = []
+
+    async def metadata_search(self, guid: str, **options: Any) -> httpx.Response:  # noqa: ARG002
+        self.requests.append(options)
+        identifiers = [m["identifier"] for m in options["metadata"]]
+
+        # NAMES ARE MATCHED CASE-INSENSITIVELY, THE RESPONSE CARRIES THE NAME AS STORED IN THOUGHTSPOT.
+        data = [
+            {"metadata_id": group_guid, "metadata_header": {"name": name}}
+            for name, group_guid in self.groups.items()
+            if name.casefold() in {i.casefold() for i in identifiers}
+        ]
+
+        return httpx.Response(
+            200,
+            json=data[: options.get("record_size", _DEFAULT_RECORD_SIZE)],
+            request=httpx.Request("POST", "https://example.thoughtspot.cloud/api/rest/2.0/metadata/search"),
+        )
+
+
+def test_resolve_group_guids_in_a_single_request():
+    groups = {f"Group {n:02}": f"guid-{n:02}" for n in range(25)}
+    http = FakeMetadataSearch(groups)
+
+    group_guids = utils.run_sync(_resolve_group_guids(list(groups), http=http))
+
+    assert group_guids == set(groups.values())
+    assert len(http.requests) == 1
+
+
+def test_resolve_group_guids_falls_back_for_partial_hits():
+    http = FakeMetadataSearch({"Sales": "guid-sales", "Marketing": "guid-marketing"})
+
+    group_guids = utils.run_sync(_resolve_group_guids(["Sales", "marketing"], http=http))
+
+    assert group_guids == {"guid-sales", "guid-marketing"}
+    assert [[m["identifier"] for m in r["metadata"]] for r in http.requests] == [["Sales", "marketing"], ["marketing"]]
+
+
+def test_resolve_group_guids_raises_for_unknown_groups():
+    http = FakeMetadataSearch({"Sales": "guid-sales"})
+
+    with pytest.raises(ValueError, match="Could not find the USER_GROUP"):
+        utils.run_sync(_resolve_group_guids(["Sales", "Finance"], http=http))
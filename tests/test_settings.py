@@ -2,15 +2,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from cs_tools import __version__
 from cs_tools.settings import CSToolsConfig
+import pydantic
 import pytest
-import toml
+import tomli_w
 
 from . import const
 
 if TYPE_CHECKING:
     import pathlib
 
+# utils.obscure("hunter2"), AS .save() WOULD WRITE IT.
+_OBSCURED = "eNrLKM0rSS0yAgAL2ALJ"
+
 
 def test_migrate_from_n_minus_one_config():
     """
@@ -18,9 +23,9 @@ def test_migrate_from_n_minus_one_config():
     files between releases since the CLI handles CRUD operations on these files.
     """
     conf = CSToolsConfig.from_toml(path=const.CST_CONFIG_N_MINUS_1, automigrate=False)
-    data = conf.model_dump()
+    data = conf.model_dump(exclude_none=True)
 
-    assert const.CST_CONFIG_N_MINUS_1.read_text() != toml.dumps(data)
+    assert const.CST_CONFIG_N_MINUS_1.read_text() != tomli_w.dumps(data)
 
 
 @pytest.mark.parametrize(
@@ -38,3 +43,56 @@ def test_load_from_toml(conf_fp: pathlib.Path):
     data = conf.model_dump()
 
     assert conf == CSToolsConfig(**data)
+
+
+def test_load_from_toml_written_by_save(tmp_path: pathlib.Path):
+    """
+    A config saved by this version of CS Tools should read back unchanged.
+    """
+    conf = CSToolsConfig(
+        name="roundtrip",
+        thoughtspot={"url": "https://example.thoughtspot.cloud/", "username": "tsadmin", "password": "hunter2"},
+        verbose=False,
+        temp_dir=tmp_path,
+        created_in_cs_tools_version=__version__,
+    )
+    conf.save(directory=tmp_path)
+
+    loaded = CSToolsConfig.from_toml(path=tmp_path / "cluster-cfg_roundtrip.toml", automigrate=False)
+
+    assert loaded == conf
+    assert loaded.thoughtspot.decoded_password == "hunter2"
+
+
+@pytest.mark.parametrize(
+    "thoughtspot",
+    [
+        pytest.param({"url": "https://example.thoughtspot.cloud", "password": _OBSCURED}, id="MISSING_USERNAME"),
+        pytest.param({"url": "https://example.thoughtspot.cloud", "username": "tsadmin"}, id="MISSING_SECRET"),
+        pytest.param({"url": "example", "username": "tsadmin", "password": _OBSCURED}, id="INVALID_URL"),
+        pytest.param(
+            {
+                "url": "https://example.thoughtspot.cloud",
+                "username": "tsadmin",
+                "password": _OBSCURED,
+                "default_org": "abc",
+            },
+            id="INVALID_DEFAULT_ORG",
+        ),
+    ],
+)
+def test_load_from_toml_rejects_hand_edited_config(tmp_path: pathlib.Path, thoughtspot: dict):
+    """
+    Configs claiming to come from this version of CS Tools are still validated.
+    """
+    data = {
+        "name": "hand-edited",
+        "thoughtspot": thoughtspot,
+        "temp_dir": tmp_path.as_posix(),
+        "created_in_cs_tools_version": __version__,
+    }
+    path = tmp_path / "cluster-cfg_hand-edited.toml"
+    path.write_text(tomli_w.dumps(data), encoding="utf-8")
+
+    with pytest.raises(pydantic.ValidationError):
+        CSToolsConfig.from_toml(path=path, automigrate=False)